@@ -15,6 +15,12 @@ KAFKA_TOPIC_ANALYTICS = os.getenv("KAFKA_TOPIC_ANALYTICS", "user-analytics")
 KAFKA_TOPIC_ANOMALIES = os.getenv("KAFKA_TOPIC_ANOMALIES", "user-anomalies")
 KAFKA_CONSUMER_GROUP = os.getenv("KAFKA_CONSUMER_GROUP", "user-analytics-group")
 
+# Message formats on KAFKA_TOPIC_EVENTS: a message without a content-type
+# header is a single JSON event; batch messages carry this header and hold
+# one JSON event per line
+KAFKA_CONTENT_TYPE_HEADER = "content-type"
+KAFKA_BATCH_CONTENT_TYPE = "application/x-ndjson"
+
 # Database Configuration
 DB_HOST = os.getenv("DB_HOST", "localhost")
 DB_PORT = int(os.getenv("DB_PORT", "5432"))
@@ -36,8 +42,10 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FORMAT = os.getenv("LOG_FORMAT", "json")  # or "text"
 
 # Producer Configuration
-PRODUCER_BATCH_SIZE = int(os.getenv("PRODUCER_BATCH_SIZE", "100"))
+PRODUCER_BATCH_SIZE = max(1, int(os.getenv("PRODUCER_BATCH_SIZE", "100")))
 PRODUCER_RATE_PER_SECOND = float(os.getenv("PRODUCER_RATE_PER_SECOND", "10"))
+PRODUCER_POLL_INTERVAL = max(1, int(os.getenv("PRODUCER_POLL_INTERVAL", "1000")))
+PRODUCER_QUEUE_SIZE = int(os.getenv("PRODUCER_QUEUE_SIZE", "10000"))
 
 # Consumer Configuration
 CONSUMER_BATCH_SIZE = int(os.getenv("CONSUMER_BATCH_SIZE", "100"))
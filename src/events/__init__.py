@@ -2,6 +2,7 @@
 
 from src.events.event_models import (
     UserEvent,
+    FastUserEvent,
     PurchaseEvent,
     VideoWatchEvent,
     ClickEvent,
@@ -14,6 +15,7 @@ from src.events.event_generator import UserEventGenerator
 
 __all__ = [
     "UserEvent",
+    "FastUserEvent",
     "PurchaseEvent",
     "VideoWatchEvent",
     "ClickEvent",
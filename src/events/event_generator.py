@@ -5,14 +5,17 @@ Generates realistic user activity without needing real users or IoT hardware.
 Phase 1: Foundation
 """
 
+import os
 import random
 import uuid
+import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Union
 from src.events.event_models import (
-    UserEvent, PurchaseEvent, VideoWatchEvent, ClickEvent, SearchEvent,
-    EventType, DeviceType
+    UserEvent, FastUserEvent, PurchaseEvent, VideoWatchEvent, ClickEvent,
+    SearchEvent, EventType, DeviceType
 )
+from src.utils.id_pool import new_uuid
 
 
 class UserEventGenerator:
@@ -60,6 +63,14 @@ class UserEventGenerator:
         "devops", "machine learning", "aws", "docker", "kubernetes"
     ]
     
+    # Event types with their own model (built via generate_user_event)
+    _SPECIALIZED_TYPES = frozenset({
+        EventType.PURCHASE, EventType.VIDEO_WATCH, EventType.CLICK, EventType.SEARCH
+    })
+    
+    # Random source for vectorized batch generation
+    _rng = np.random.default_rng()
+    
     @classmethod
     def generate_user_event(
         cls,
@@ -67,10 +78,13 @@ class UserEventGenerator:
         session_id: Optional[str] = None,
         event_type: Optional[EventType] = None,
         timestamp: Optional[datetime] = None
-    ) -> UserEvent:
+    ) -> Union[UserEvent, FastUserEvent]:
         """
         Generate a random user event.
         
+        Generic event types are emitted as FastUserEvent, the specialized
+        ones (purchase, video, click, search) as their UserEvent subclass.
+        
         Args:
             user_id: User ID (random if not provided)
             session_id: Session ID (random if not provided)
@@ -78,7 +92,7 @@ class UserEventGenerator:
             timestamp: Event timestamp (current time if not provided)
         
         Returns:
-            UserEvent: Generated event
+            Generated event (UserEvent subclass or FastUserEvent)
             
         Example:
             >>> event = UserEventGenerator.generate_user_event()
@@ -109,6 +123,21 @@ class UserEventGenerator:
             "page": random.choice(cls.PAGES),
             "ip_address": f"{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}"
         }
+        return cls._build_event(base_event)
+    
+    @classmethod
+    def _build_event(cls, base_event: dict) -> Union[UserEvent, FastUserEvent]:
+        """
+        Build the model for base_event, adding event-specific data.
+        
+        Args:
+            base_event: Common fields (user, session, type, timestamp, device,
+                country, page, ip_address)
+        
+        Returns:
+            Specialized event for purchase/video/click/search, else FastUserEvent
+        """
+        event_type = base_event["event_type"]
         
         # Add event-specific data based on event type
         if event_type == EventType.PURCHASE:
@@ -154,33 +183,81 @@ class UserEventGenerator:
         
         else:
             # Generic event for LOGIN, LOGOUT, PAGE_VIEW, CART_ADD, etc.
-            return UserEvent(**base_event)
+            return FastUserEvent(**base_event)
     
     @classmethod
     def generate_batch(
         cls,
         count: int = 10,
         user_id: Optional[str] = None
-    ) -> List[UserEvent]:
+    ) -> List[Union[UserEvent, FastUserEvent]]:
         """
         Generate a batch of events.
         
+        All random columns (users, types, devices, timestamps, IPs, ...) are
+        drawn in one go with NumPy. Generic events are then built with
+        FastUserEvent.model_construct, which skips per-event validation:
+        the caller's user_id is checked once up front and every other
+        value comes from the sample data above. Specialized event types
+        reuse the same columns and only draw their type-specific fields.
+        
         Args:
             count: Number of events to generate
             user_id: Optional user ID (if None, events for random users)
         
         Returns:
-            List of UserEvent objects
+            List of events: FastUserEvent for generic types, UserEvent
+            subclasses for purchase/video/click/search
+        
+        Raises:
+            ValueError: If user_id is given but empty
             
         Example:
             >>> events = UserEventGenerator.generate_batch(count=50)
             >>> print(len(events), "events generated")
             50 events generated
         """
+        rng = cls._rng
+        event_types = list(EventType)
+        devices = list(DeviceType)
+        
+        if user_id is None:
+            users = [cls.USERS[i] for i in rng.integers(0, len(cls.USERS), count).tolist()]
+        else:
+            # model_construct won't run the validator, so apply it here once
+            users = [FastUserEvent.validate_user_id(user_id)] * count
+        
+        session_ids = [f"sess_{n:012x}" for n in rng.integers(0, 1 << 48, count).tolist()]
+        types = [event_types[i] for i in rng.integers(0, len(event_types), count).tolist()]
+        # Events from the last 24 hours, as in generate_user_event
+        offsets = rng.integers(0, 86401, count).tolist()
+        device_col = [devices[i] for i in rng.integers(0, len(devices), count).tolist()]
+        countries = [cls.COUNTRIES[i] for i in rng.integers(0, len(cls.COUNTRIES), count).tolist()]
+        pages = [cls.PAGES[i] for i in rng.integers(0, len(cls.PAGES), count).tolist()]
+        ips = ["%d.%d.%d.%d" % tuple(octets) for octets in rng.integers(1, 256, (count, 4)).tolist()]
+        
+        now = datetime.utcnow()
+        construct = FastUserEvent.model_construct
+        build = cls._build_event
+        specialized = cls._SPECIALIZED_TYPES
         events = []
-        for _ in range(count):
-            event = cls.generate_user_event(user_id=user_id)
-            events.append(event)
+        for uid, sid, event_type, offset, device, country, page, ip in zip(
+            users, session_ids, types, offsets, device_col, countries, pages, ips
+        ):
+            base_event = {
+                "user_id": uid,
+                "session_id": sid,
+                "event_type": event_type,
+                "timestamp": now - timedelta(seconds=offset),
+                "device": device,
+                "country": country,
+                "page": page,
+                "ip_address": ip
+            }
+            if event_type in specialized:
+                events.append(build(base_event))
+            else:
+                events.append(construct(event_id=new_uuid(), **base_event))
         return events
     
     @classmethod
@@ -188,7 +265,7 @@ class UserEventGenerator:
         cls,
         user_id: Optional[str] = None,
         event_count: int = 20
-    ) -> tuple[str, List[UserEvent]]:
+    ) -> tuple[str, List[Union[UserEvent, FastUserEvent]]]:
         """
         Generate a realistic user session with multiple events.
         
@@ -362,4 +439,13 @@ class UserEventGenerator:
             "search_queries": len(cls.SEARCH_QUERIES),
             "event_types": len(list(EventType)),
             "device_types": len(list(DeviceType))
-        }
\ No newline at end of file
+        }
+
+
+def _reseed_after_fork():
+    """Fork hook: give each child its own batch RNG stream"""
+    UserEventGenerator._rng = np.random.default_rng()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_after_fork)
\ No newline at end of file
@@ -5,20 +5,33 @@ Sends mock user events to Kafka topics in real-time with proper error handling.
 Phase 1: Foundation
 """
 
-import json
 import logging
+import queue
+import threading
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from confluent_kafka import Producer, KafkaException
 from datetime import datetime
-from src.events.event_models import UserEvent
+from src.events.event_models import UserEvent, FastUserEvent, EventBatch
 from src.events.event_generator import UserEventGenerator
 from config.logging_config import setup_logging
-from config.constants import KAFKA_BOOTSTRAP_SERVERS, KAFKA_TOPIC_EVENTS
+from config.constants import (
+    KAFKA_BOOTSTRAP_SERVERS, KAFKA_TOPIC_EVENTS, PRODUCER_BATCH_SIZE,
+    PRODUCER_POLL_INTERVAL, PRODUCER_QUEUE_SIZE, KAFKA_CONTENT_TYPE_HEADER,
+    KAFKA_BATCH_CONTENT_TYPE
+)
 
 # Setup logging
 logger = setup_logging(__name__)
 
+# Marks JSON-lines batch messages (see send_event_batch)
+_BATCH_HEADERS = [(KAFKA_CONTENT_TYPE_HEADER, KAFKA_BATCH_CONTENT_TYPE.encode())]
+
+# Producer-side message size limit, and the largest batch payload we put in
+# one message (headroom left for the key, headers and record framing)
+_MAX_MESSAGE_BYTES = 1000000
+_BATCH_CHUNK_BYTES = _MAX_MESSAGE_BYTES - 64 * 1024
+
 
 class UserEventProducer:
     """
@@ -70,35 +83,37 @@ class UserEventProducer:
             'acks': 'all',
             'retries': 3,
             'compression.type': 'snappy',
-            'message.max.bytes': 1000000,
+            'message.max.bytes': _MAX_MESSAGE_BYTES,
+            # Room for large batches in the local queue, sent in big MessageSets
+            'queue.buffering.max.messages': 1000000,
+            'batch.num.messages': 10000,
         }
         
         return Producer(producer_config)
     
-    def _delivery_report(self, err, msg):
+    def _delivery_report(self, err, msg, event_count: int = 1):
         """
         Callback for delivery reports.
         
         Args:
             err: Error if any
             msg: Message that was delivered
+            event_count: Number of events carried by the message
         """
         if err is not None:
-            logger.error(f"Message delivery failed: {err}")
-            self.events_failed += 1
+            logger.error("Message delivery failed: %s", err)
+            self.events_failed += event_count
         else:
-            self.events_sent += 1
+            self.events_sent += event_count
             self.total_bytes_sent += len(msg.value())
             
-            if self.events_sent % 100 == 0:
+            if self.events_sent % 100 == 0 and logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
-                    f"Events sent: {self.events_sent} | "
-                    f"Topic: {msg.topic()} | "
-                    f"Partition: {msg.partition()} | "
-                    f"Offset: {msg.offset()}"
+                    "Events sent: %d | Topic: %s | Partition: %s | Offset: %s",
+                    self.events_sent, msg.topic(), msg.partition(), msg.offset()
                 )
     
-    def send_event(self, event: UserEvent) -> bool:
+    def send_event(self, event: Union[UserEvent, FastUserEvent]) -> bool:
         """
         Send a single user event to Kafka.
         
@@ -109,13 +124,32 @@ class UserEventProducer:
             True if sent successfully, False otherwise
         """
         try:
-            event_dict = event.to_dict()
-            event_json = json.dumps(event_dict, default=str, ensure_ascii=False).encode('utf-8')
-            
+            event_json = event.to_json_bytes()
+        except Exception as e:
+            logger.error("Error encoding event: %s", e)
+            self.events_failed += 1
+            return False
+        
+        return self.send_raw(event_json)
+    
+    def send_raw(self, payload: bytes) -> bool:
+        """
+        Send an already-encoded event to Kafka.
+        
+        Skips model serialization, so callers can encode an event once
+        (e.g. with to_json_bytes()) and send the same bytes repeatedly.
+        
+        Args:
+            payload: JSON-encoded event
+        
+        Returns:
+            True if queued successfully, False otherwise
+        """
+        try:
             # Send with delivery report callback
             self.producer.produce(
                 self.topic,
-                value=event_json,
+                value=payload,
                 callback=self._delivery_report
             )
             
@@ -134,21 +168,133 @@ class UserEventProducer:
             self.events_failed += 1
             return False
     
-    def send_batch(self, events: list[UserEvent]) -> int:
+    def send_batch(
+        self,
+        events: list[Union[UserEvent, FastUserEvent]],
+        flush_timeout: float = 10
+    ) -> tuple[int, int]:
         """
         Send multiple events to Kafka.
         
+        Events go straight to produce(); delivery success is only known
+        asynchronously (see _delivery_report), so no per-event result is
+        tracked here. librdkafka is polled every PRODUCER_POLL_INTERVAL
+        messages and always flushed once at the end. Events that fail to
+        encode or produce (e.g. KafkaException) are logged, counted in
+        events_failed and skipped.
+        
         Args:
-            events: List of UserEvent objects
+            events: Events to send (UserEvent subclasses or FastUserEvent)
+            flush_timeout: Seconds to wait for outstanding deliveries
         
         Returns:
-            Number of events sent successfully
+            Tuple of (events queued, events rejected because the local
+            producer queue was full)
         """
-        sent_count = 0
-        for event in events:
-            if self.send_event(event):
-                sent_count += 1
-        return sent_count
+        produce = self.producer.produce
+        poll = self.producer.poll
+        topic = self.topic
+        callback = self._delivery_report
+        queued = 0
+        buffer_full = 0
+        errors = 0
+        
+        try:
+            for event in events:
+                try:
+                    produce(topic, value=event.to_json_bytes(), callback=callback)
+                except BufferError:
+                    buffer_full += 1
+                    continue
+                except Exception as e:
+                    errors += 1
+                    logger.error("Error sending event in batch: %s", e)
+                    continue
+                queued += 1
+                if queued % PRODUCER_POLL_INTERVAL == 0:
+                    poll(0)
+        
+        finally:
+            self.producer.flush(timeout=flush_timeout)
+            self.events_failed += buffer_full + errors
+            if buffer_full:
+                logger.warning("Producer queue full, %d events not queued", buffer_full)
+        
+        return queued, buffer_full
+    
+    @staticmethod
+    def _split_jsonl(payload: bytes, max_bytes: int):
+        """
+        Split a JSON-lines payload on line boundaries.
+        
+        Chunks are at most max_bytes long, except that a single line longer
+        than max_bytes becomes a chunk of its own.
+        
+        Args:
+            payload: JSON-lines bytes, every line terminated by a newline
+            max_bytes: Target maximum chunk size
+        
+        Yields:
+            (chunk, line_count) tuples
+        """
+        start = 0
+        end = len(payload)
+        while start < end:
+            if end - start <= max_bytes:
+                cut = end
+            else:
+                cut = payload.rfind(b"\n", start, start + max_bytes) + 1
+                if cut <= start:
+                    cut = payload.find(b"\n", start + max_bytes) + 1 or end
+            chunk = payload[start:cut]
+            yield chunk, chunk.count(b"\n")
+            start = cut
+    
+    def send_event_batch(self, batch: EventBatch) -> bool:
+        """
+        Send a batch as JSON-lines Kafka messages.
+        
+        The batch is encoded as JSON lines (one event per line), so
+        librdkafka handles one message per chunk instead of one per event.
+        Payloads larger than the message size limit are split on line
+        boundaries into several messages, all keyed by the batch ID so they
+        land on the same partition in order. Each message carries a
+        content-type: application/x-ndjson header so consumers can tell it
+        apart from single-event JSON messages on the same topic, and must
+        split its value on newlines.
+        
+        Args:
+            batch: EventBatch to send
+        
+        Returns:
+            True if every message was queued, False otherwise (events from
+            the failed message onwards are counted as failed)
+        """
+        remaining = len(batch.events)
+        try:
+            for chunk, event_count in self._split_jsonl(
+                batch.to_jsonl_bytes(), _BATCH_CHUNK_BYTES
+            ):
+                self.producer.produce(
+                    self.topic,
+                    value=chunk,
+                    key=batch.batch_id,
+                    headers=_BATCH_HEADERS,
+                    callback=lambda err, msg, n=event_count: self._delivery_report(err, msg, n)
+                )
+                remaining -= event_count
+            self.producer.poll(0)
+            return True
+        
+        except KafkaException as e:
+            logger.error("Kafka error sending batch %s: %s", batch.batch_id, e)
+            self.events_failed += remaining
+            return False
+        
+        except Exception as e:
+            logger.error("Error sending batch %s: %s", batch.batch_id, e)
+            self.events_failed += remaining
+            return False
     
     def generate_and_send(
         self,
@@ -175,26 +321,58 @@ class UserEventProducer:
         self.start_time = time.time()
         interval = 1.0 / events_per_second if events_per_second > 0 else 0
         
-        for i in range(event_count):
-            # Generate event
-            event = UserEventGenerator.generate_user_event(user_id=user_id)
-            
-            # Send event
-            self.send_event(event)
-            
-            # Rate limiting
-            if events_per_second > 0:
-                elapsed = time.time() - self.start_time - (i * interval)
-                if elapsed < 0:
-                    time.sleep(-elapsed)
-            
-            # Progress logging
-            if (i + 1) % 100 == 0:
-                logger.info(f"Progress: {i + 1}/{event_count} events sent")
+        # Generation and encoding run in a worker thread, so that Python
+        # work overlaps with librdkafka's network I/O (which releases the GIL)
+        pending = queue.Queue(maxsize=max(1, PRODUCER_QUEUE_SIZE // PRODUCER_BATCH_SIZE))
+        stop = threading.Event()
+        worker_errors = []
+        worker = threading.Thread(
+            target=self._generate_encoded,
+            args=(event_count, user_id, pending, stop, worker_errors),
+            name="event-generator",
+            daemon=True
+        )
+        worker.start()
+        
+        i = 0
+        try:
+            while True:
+                chunk = pending.get()
+                if chunk is None:
+                    break
+                
+                for payload in chunk:
+                    # Send event
+                    self.send_raw(payload)
+                    
+                    # Rate limiting
+                    if events_per_second > 0:
+                        elapsed = time.time() - self.start_time - (i * interval)
+                        if elapsed < 0:
+                            time.sleep(-elapsed)
+                    
+                    i += 1
+                    
+                    # Progress logging
+                    if i % 100 == 0:
+                        logger.info("Progress: %d/%d events sent", i, event_count)
+        
+        finally:
+            # Unblock the worker if we leave early (e.g. KeyboardInterrupt)
+            stop.set()
+            worker.join()
         
         # Ensure all messages are sent
         self.producer.flush(timeout=10)
         
+        if worker_errors:
+            self.events_failed += event_count - i
+            logger.error(
+                "Event generation failed after %d/%d events: %s",
+                i, event_count, worker_errors[0]
+            )
+            raise worker_errors[0]
+        
         elapsed_time = time.time() - self.start_time
         
         stats = {
@@ -215,6 +393,57 @@ class UserEventProducer:
         logger.info(f"Stats: {stats}")
         return stats
     
+    def _generate_encoded(
+        self,
+        event_count: int,
+        user_id: Optional[str],
+        out: queue.Queue,
+        stop: threading.Event,
+        errors: list
+    ):
+        """
+        Worker for generate_and_send: generate events in chunks of
+        PRODUCER_BATCH_SIZE and put each chunk on the queue as a list of
+        encoded payloads. Finishes with a None sentinel unless stopped.
+        
+        Args:
+            event_count: Number of events to generate
+            user_id: Optional specific user (if None, random users)
+            out: Queue shared with the sending thread
+            stop: Set by the sending thread when it stops reading
+            errors: Receives the exception if generation fails
+        """
+        try:
+            for start in range(0, event_count, PRODUCER_BATCH_SIZE):
+                events = UserEventGenerator.generate_batch(
+                    count=min(PRODUCER_BATCH_SIZE, event_count - start),
+                    user_id=user_id
+                )
+                if not self._put_until_stopped(
+                    out, [event.to_json_bytes() for event in events], stop
+                ):
+                    return
+        except Exception as e:
+            errors.append(e)
+        finally:
+            self._put_until_stopped(out, None, stop)
+    
+    @staticmethod
+    def _put_until_stopped(out: queue.Queue, item, stop: threading.Event) -> bool:
+        """
+        Put item on a bounded queue, giving up once stop is set.
+        
+        Returns:
+            True if the item was queued, False if stopped first
+        """
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
     def continuous_stream(
         self,
         events_per_second: float = 10,
@@ -234,33 +463,51 @@ class UserEventProducer:
         )
         
         self.start_time = time.time()
+        start = time.monotonic()
         end_time = None
         if duration_minutes:
-            end_time = self.start_time + (duration_minutes * 60)
+            end_time = start + (duration_minutes * 60)
         
         interval = 1.0 / events_per_second
         event_count = 0
         
+        # Bind hot-loop callables to locals (LOAD_FAST instead of attribute lookups)
+        send = self.send_event
+        generate = UserEventGenerator.generate_user_event
+        monotonic = time.monotonic
+        sleep = time.sleep
+        
+        # Deadline scheduling: time spent generating/sending counts
+        # against the interval instead of being added on top of it.
+        # Lag of more than one interval is dropped, not made up.
+        next_time = start
+        
         try:
             while True:
-                if end_time and time.time() >= end_time:
+                if end_time and monotonic() >= end_time:
                     logger.info("Duration reached, stopping stream")
                     break
                 
                 # Generate and send event
-                event = UserEventGenerator.generate_user_event()
-                self.send_event(event)
+                send(generate())
                 event_count += 1
                 
                 # Rate limiting
-                time.sleep(interval)
+                next_time += interval
+                delay = next_time - monotonic()
+                if delay > 0:
+                    sleep(delay)
+                elif delay < -interval:
+                    # Fell behind (GC pause, slow produce, suspend): resume
+                    # from now instead of bursting to catch up
+                    next_time = monotonic()
                 
                 # Progress logging
                 if event_count % 1000 == 0:
-                    elapsed = time.time() - self.start_time
+                    elapsed = monotonic() - start
                     logger.info(
-                        f"Streamed {event_count} events in {elapsed:.1f}s "
-                        f"({event_count/elapsed:.1f} events/sec)"
+                        "Streamed %d events in %.1fs (%.1f events/sec)",
+                        event_count, elapsed, event_count / elapsed
                     )
         
         except KeyboardInterrupt:
@@ -268,7 +515,7 @@ class UserEventProducer:
         
         finally:
             self.producer.flush(timeout=10)
-            elapsed = time.time() - self.start_time
+            elapsed = time.monotonic() - start
             logger.info(
                 f"Stream stopped. Total events: {event_count}, "
                 f"Duration: {elapsed:.1f}s"
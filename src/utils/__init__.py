@@ -1,3 +1,5 @@
 """Utility functions and helpers."""
 
-__all__ = []
\ No newline at end of file
+from src.utils.id_pool import UUIDPool, new_uuid
+
+__all__ = ["UUIDPool", "new_uuid"]
\ No newline at end of file
@@ -0,0 +1 @@
+"""Tests for event models and generators."""
\ No newline at end of file
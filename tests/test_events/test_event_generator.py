@@ -0,0 +1,77 @@
+"""
+Tests for the mock event generator.
+"""
+
+import os
+
+import pytest
+
+from src.events.event_generator import UserEventGenerator
+from src.events.event_models import (
+    UserEvent, FastUserEvent, PurchaseEvent, VideoWatchEvent, ClickEvent,
+    SearchEvent, EventType, DeviceType
+)
+
+SPECIALIZED = {
+    EventType.PURCHASE: PurchaseEvent,
+    EventType.VIDEO_WATCH: VideoWatchEvent,
+    EventType.CLICK: ClickEvent,
+    EventType.SEARCH: SearchEvent,
+}
+
+
+@pytest.mark.parametrize("count", [0, 1, 250])
+def test_generate_batch_length(count):
+    assert len(UserEventGenerator.generate_batch(count=count)) == count
+
+
+def test_generate_batch_types():
+    events = UserEventGenerator.generate_batch(count=500, user_id="user_test")
+    for event in events:
+        assert event.user_id == "user_test"
+        assert isinstance(event.device, DeviceType)
+        assert event.country in UserEventGenerator.COUNTRIES
+        assert event.page in UserEventGenerator.PAGES
+        if event.event_type in SPECIALIZED:
+            assert type(event) is SPECIALIZED[event.event_type]
+        else:
+            assert type(event) is FastUserEvent
+            # Generic rows skip validation, so check they still round-trip
+            assert UserEvent.model_validate_json(event.to_json_bytes()).event_id == event.event_id
+
+    assert {type(event) for event in events} == {FastUserEvent, *SPECIALIZED.values()}
+    assert len({event.event_id for event in events}) == len(events)
+
+
+@pytest.mark.parametrize("count", [0, 1, 250])
+@pytest.mark.parametrize("user_id", ["", "   "])
+def test_generate_batch_rejects_blank_user_id(count, user_id):
+    with pytest.raises(ValueError, match="user_id cannot be empty"):
+        UserEventGenerator.generate_batch(count=count, user_id=user_id)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_draws_different_sessions():
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Never return into pytest from the child, whatever happens
+        ok = False
+        try:
+            os.close(read_fd)
+            events = UserEventGenerator.generate_batch(count=20)
+            os.write(write_fd, "\n".join(e.session_id for e in events).encode())
+            os.close(write_fd)
+            ok = True
+        finally:
+            os._exit(0 if ok else 1)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as reader:
+        child_sessions = reader.read().split("\n")
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+
+    parent_sessions = [e.session_id for e in UserEventGenerator.generate_batch(count=20)]
+    assert len(child_sessions) == 20
+    assert not set(child_sessions) & set(parent_sessions)
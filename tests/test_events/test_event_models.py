@@ -0,0 +1,43 @@
+"""
+Tests for event model serialization.
+"""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from src.events.event_generator import UserEventGenerator
+from src.events.event_models import EventBatch, EventType, FastUserEvent, UserEvent
+
+
+def test_event_batch_jsonl_round_trip():
+    events = UserEventGenerator.generate_batch(count=50)
+    batch = EventBatch(events=events)
+
+    payload = batch.to_jsonl_bytes()
+    lines = payload.split(b"\n")
+
+    assert payload.endswith(b"\n")
+    assert lines[-1] == b""
+    assert [json.loads(line) for line in lines[:-1]] == batch.to_list()
+    parsed = [UserEvent.model_validate_json(line) for line in lines[:-1]]
+    assert [e.event_id for e in parsed] == [e.event_id for e in events]
+
+
+def test_empty_event_batch_encodes_to_empty_payload():
+    assert EventBatch(events=[]).to_jsonl_bytes() == b""
+
+
+@pytest.mark.parametrize("field", ["user_id", "session_id"])
+@pytest.mark.parametrize("blank", ["", "   "])
+def test_fast_user_event_rejects_blank_ids(field, blank):
+    values = {"user_id": "user_00001", "session_id": "sess_abc", "event_type": EventType.LOGIN}
+    values[field] = blank
+    with pytest.raises(ValidationError):
+        FastUserEvent(**values)
+
+
+def test_generate_user_event_rejects_blank_user_id():
+    with pytest.raises(ValidationError):
+        UserEventGenerator.generate_user_event(user_id="   ", event_type=EventType.LOGIN)
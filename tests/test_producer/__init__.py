@@ -0,0 +1 @@
+"""Tests for the Kafka producer."""
\ No newline at end of file
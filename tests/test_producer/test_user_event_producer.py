@@ -0,0 +1,181 @@
+"""
+Tests for UserEventProducer using a stub in place of confluent_kafka.Producer.
+"""
+
+import pytest
+
+import src.producer.user_event_producer as producer_module
+from config.constants import KAFKA_BATCH_CONTENT_TYPE, KAFKA_CONTENT_TYPE_HEADER
+from src.events.event_generator import UserEventGenerator
+from src.events.event_models import EventBatch
+from src.producer.user_event_producer import UserEventProducer
+
+
+class StubProducer:
+    """Records produce() calls; raises from `errors` keyed by attempt number"""
+
+    def __init__(self, config=None):
+        self.config = config
+        self.messages = []
+        self.errors = {}
+        self.attempts = 0
+        self.polls = 0
+        self.flushes = 0
+
+    def produce(self, topic, value=None, key=None, headers=None, callback=None):
+        attempt = self.attempts
+        self.attempts += 1
+        if attempt in self.errors:
+            raise self.errors[attempt]
+        self.messages.append(
+            {"topic": topic, "value": value, "key": key, "headers": headers,
+             "callback": callback}
+        )
+
+    def poll(self, timeout=None):
+        self.polls += 1
+        return 0
+
+    def flush(self, timeout=None):
+        self.flushes += 1
+        return 0
+
+
+@pytest.fixture
+def producer(monkeypatch):
+    monkeypatch.setattr(producer_module, "Producer", StubProducer)
+    return UserEventProducer(bootstrap_servers="stub:9092", topic="test-events")
+
+
+def test_send_event_batch_marks_ndjson_header(producer):
+    batch = EventBatch(events=UserEventGenerator.generate_batch(count=5))
+
+    assert producer.send_event_batch(batch) is True
+
+    (message,) = producer.producer.messages
+    assert message["headers"] == [
+        (KAFKA_CONTENT_TYPE_HEADER, KAFKA_BATCH_CONTENT_TYPE.encode())
+    ]
+    assert message["value"] == batch.to_jsonl_bytes()
+
+
+def test_send_event_batch_splits_oversized_batch(producer, monkeypatch):
+    monkeypatch.setattr(producer_module, "_BATCH_CHUNK_BYTES", 2000)
+    batch = EventBatch(events=UserEventGenerator.generate_batch(count=50))
+
+    assert producer.send_event_batch(batch) is True
+
+    messages = producer.producer.messages
+    assert len(messages) > 1
+    assert all(len(m["value"]) <= 2000 for m in messages)
+    assert all(m["value"].endswith(b"\n") for m in messages)
+    assert all(m["key"] == batch.batch_id for m in messages)
+    assert b"".join(m["value"] for m in messages) == batch.to_jsonl_bytes()
+
+    # Each message reports its own event count on delivery failure
+    for message in messages:
+        message["callback"]("delivery failed", None)
+    assert producer.events_failed == 50
+
+
+def test_send_event_batch_fits_message_size_limit(producer):
+    batch = EventBatch(events=UserEventGenerator.generate_batch(count=4000))
+    assert len(batch.to_jsonl_bytes()) > producer_module._MAX_MESSAGE_BYTES
+
+    assert producer.send_event_batch(batch) is True
+
+    messages = producer.producer.messages
+    assert len(messages) > 1
+    assert all(len(m["value"]) <= producer_module._BATCH_CHUNK_BYTES for m in messages)
+
+
+def test_send_event_has_no_content_type_header(producer):
+    producer.send_event(UserEventGenerator.generate_user_event())
+
+    (message,) = producer.producer.messages
+    assert message["headers"] is None
+
+
+def test_continuous_stream_does_not_burst_after_stall(producer, monkeypatch):
+    # Fake clock: sleep() advances it, one send() stalls it by 60 seconds
+    clock = {"now": 0.0}
+    sends = {"count": 0}
+
+    def fake_send(event):
+        sends["count"] += 1
+        if sends["count"] == 5:
+            clock["now"] += 60.0
+        return True
+
+    def fake_sleep(seconds):
+        clock["now"] += seconds
+
+    monkeypatch.setattr(producer_module.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(producer_module.time, "sleep", fake_sleep)
+    monkeypatch.setattr(producer, "send_event", fake_send)
+
+    # 10 events/sec for 65 seconds: the 60s stall must not be made up
+    producer.continuous_stream(events_per_second=10, duration_minutes=65 / 60)
+
+    assert sends["count"] <= 5 + 10 * 5 + 1
+
+
+def test_send_batch_returns_queued_and_buffer_full(producer):
+    events = UserEventGenerator.generate_batch(count=10)
+    producer.producer.errors = {2: BufferError("queue full"), 7: BufferError("queue full")}
+
+    assert producer.send_batch(events) == (8, 2)
+    assert len(producer.producer.messages) == 8
+    assert producer.producer.flushes == 1
+    assert producer.events_failed == 2
+
+
+def test_send_batch_counts_kafka_errors_and_still_flushes(producer):
+    events = UserEventGenerator.generate_batch(count=5)
+    producer.producer.errors = {1: producer_module.KafkaException("broker down")}
+
+    assert producer.send_batch(events) == (4, 0)
+    assert producer.producer.flushes == 1
+    assert producer.events_failed == 1
+
+
+def test_generate_and_send_propagates_worker_error(producer, monkeypatch):
+    def failing_batch(count=10, user_id=None):
+        raise RuntimeError("generator broke")
+
+    monkeypatch.setattr(UserEventGenerator, "generate_batch", failing_batch)
+
+    with pytest.raises(RuntimeError, match="generator broke"):
+        producer.generate_and_send(event_count=10, events_per_second=0)
+    assert producer.events_failed == 10
+
+
+def test_generate_and_send_counts_events_missing_after_worker_error(producer, monkeypatch):
+    real_batch = UserEventGenerator.generate_batch
+    calls = {"count": 0}
+
+    def flaky_batch(count=10, user_id=None):
+        calls["count"] += 1
+        if calls["count"] > 1:
+            raise RuntimeError("generator broke")
+        return real_batch(count=count, user_id=user_id)
+
+    monkeypatch.setattr(UserEventGenerator, "generate_batch", flaky_batch)
+
+    with pytest.raises(RuntimeError):
+        producer.generate_and_send(event_count=150, events_per_second=0)
+    assert len(producer.producer.messages) == 100
+    assert producer.events_failed == 50
+
+
+def test_generate_and_send_stops_worker_when_sender_exits_early(producer, monkeypatch):
+    monkeypatch.setattr(producer_module, "PRODUCER_QUEUE_SIZE", 100)
+
+    def interrupted(payload):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(producer, "send_raw", interrupted)
+
+    with pytest.raises(KeyboardInterrupt):
+        producer.generate_and_send(event_count=5000, events_per_second=0)
+    assert not any(t.name == "event-generator" for t in producer_module.threading.enumerate())
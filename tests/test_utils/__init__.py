@@ -0,0 +1 @@
+"""Tests for utility helpers."""
\ No newline at end of file
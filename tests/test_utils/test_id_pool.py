@@ -0,0 +1,70 @@
+"""
+Tests for the pre-generated UUID pool.
+"""
+
+import os
+import time
+import uuid
+
+import pytest
+
+from src.utils import id_pool
+from src.utils.id_pool import UUIDPool, new_uuid
+
+
+def _wait_for(predicate, timeout=2.0):
+    """Poll until predicate() is true or the timeout expires"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_empty_pool_falls_back_to_inline_uuid():
+    pool = UUIDPool(size=8, low_water=2)
+    value = pool.next_id()
+    assert str(uuid.UUID(value)) == value
+    assert pool._thread is not None
+
+
+def test_pool_refills_in_background():
+    pool = UUIDPool(size=64, low_water=16)
+    pool.next_id()
+    assert _wait_for(lambda: len(pool._pool) == 64)
+
+    ids = [pool.next_id() for _ in range(60)]
+    assert len(set(ids)) == 60
+    assert _wait_for(lambda: len(pool._pool) == 64)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_does_not_reuse_parent_ids():
+    # Warm the shared pool so the parent has buffered IDs at fork time
+    new_uuid()
+    assert _wait_for(lambda: len(id_pool._default_pool._pool) > 100)
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Never return into pytest from the child, whatever happens
+        ok = False
+        try:
+            os.close(read_fd)
+            child_ids = [new_uuid() for _ in range(5)]
+            os.write(write_fd, "\n".join(child_ids).encode())
+            os.close(write_fd)
+            ok = True
+        finally:
+            os._exit(0 if ok else 1)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as reader:
+        child_ids = reader.read().split("\n")
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+
+    parent_ids = [new_uuid() for _ in range(5)]
+    assert len(child_ids) == 5
+    assert not set(child_ids) & set(parent_ids)